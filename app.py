@@ -1,12 +1,26 @@
+import importlib.util
+import os
+
+# Use the Rust-based hf_transfer backend for Hub downloads/uploads when it is installed.
+# Must be set before gradio / huggingface_hub are imported.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 import gradio as gr
 from gradio_leaderboard import Leaderboard
+import glob
 import json
-import os
+import math
+import orjson
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
-from huggingface_hub import HfApi, hf_hub_download
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from huggingface_hub import CommitOperationAdd, HfApi, hf_hub_download, snapshot_download
+from huggingface_hub.utils import LocalEntryNotFoundError
 from datasets import load_dataset, Dataset
 import threading
 from dotenv import load_dotenv
@@ -24,7 +38,7 @@ load_dotenv()
 # Parse command-line arguments
 parser = argparse.ArgumentParser(description='SWE Agent PR Leaderboard')
 parser.add_argument('--debug', '--DEBUG', action='store_true',
-                    help='Enable debug mode (limits PR retrieval to 10 per query pattern)')
+                    help='Enable debug mode (limits PR retrieval to 10 per agent)')
 parser.add_argument('--no-debug', '--production', action='store_true',
                     help='Explicitly disable debug mode (force production mode)')
 args = parser.parse_args()
@@ -34,7 +48,7 @@ args = parser.parse_args()
 # =============================================================================
 
 # DEBUG MODE: Set to True to limit PR retrieval for testing
-# When enabled, only fetches up to 10 PRs per query pattern per agent
+# When enabled, only fetches up to 10 PRs per agent
 # Priority: 1) Command-line args, 2) Environment variable, 3) Default (False)
 if args.no_debug:
     DEBUG_MODE = False
@@ -50,6 +64,52 @@ AGENTS_REPO = "SWE-Arena/swe_agents"  # HuggingFace dataset for agent metadata
 PR_METADATA_REPO = "SWE-Arena/pr_metadata"  # HuggingFace dataset for PR metadata
 LEADERBOARD_TIME_FRAME_DAYS = 180  # Time frame for leaderboard (past 6 months)
 
+# Mining is I/O-bound on GitHub / HuggingFace latency, so agents are processed concurrently
+MAX_AGENT_WORKERS = 6  # Number of agents mined in parallel
+PAGE_FETCH_WORKERS = 4  # Search result pages fetched in parallel within one time partition
+SEARCH_API_SEMAPHORE = threading.Semaphore(5)  # Max in-flight GitHub Search API calls (30 req/min cap)
+HF_API_SEMAPHORE = threading.Semaphore(4)  # Max in-flight HuggingFace Hub transfers
+
+# Conditional-request cache for GitHub Search API pages, persisted between runs.
+# A 304 Not Modified reply does not count against the primary rate limit.
+GITHUB_ETAG_CACHE_FILE = ".github_etag_cache.json"
+GITHUB_ETAG_CACHE = None  # {cache_key: [etag, page_data]}, loaded lazily
+GITHUB_ETAG_CACHE_USED = set()  # Keys touched during the current run
+GITHUB_ETAG_CACHE_LOCK = threading.Lock()
+
+# PR search backend: "graphql" (default, needs a token, only the fields we store are returned)
+# or "rest" (Search API with ETag caching). REST is also the fallback when GraphQL fails.
+# GraphQL pages are fetched sequentially by endCursor and never revalidated with ETags, so the
+# REST-only ETag reuse and parallel page fetch are off unless GITHUB_SEARCH_BACKEND=rest.
+GITHUB_SEARCH_BACKEND = os.getenv('GITHUB_SEARCH_BACKEND', 'graphql').lower()
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+# ISSUE_ADVANCED enables parentheses / OR between qualifiers, like advanced_search on REST
+GRAPHQL_SEARCH_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE_ADVANCED, first: 100, after: $cursor) {
+    issueCount
+    pageInfo { endCursor hasNextPage }
+    nodes { ... on PullRequest { url createdAt mergedAt closedAt } }
+  }
+}
+"""
+
+# Local mirror of PR_METADATA_REPO day files; snapshot_download only fetches files that changed remotely
+PR_METADATA_LOCAL_DIR = ".pr_metadata"
+
+# Per-agent PR density (PRs/day) observed on the last run, used to pre-split search windows
+# so dense agents do not pay probe-then-split round-trips against the 1000-result cap
+PR_DENSITY_FILE = ".pr_density.json"
+PR_DENSITY_TARGET_PER_WINDOW = 800  # Expected PRs per initial window (headroom under 1000)
+PR_DENSITY_MAX_DAYS_PER_WINDOW = 32  # Longest initial window, so older windows repeat between runs
+PR_DENSITY_ESTIMATES = None  # {agent_identifier: prs_per_day}, loaded lazily
+PR_DENSITY_LOCK = threading.Lock()
+
+# Agent JSON files rarely change; the local snapshot is only revalidated against the Hub
+# when the stamp file is older than AGENTS_CACHE_TTL_SECONDS
+AGENTS_CACHE_STAMP_FILE = ".agents_cache_stamp"
+AGENTS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
 LEADERBOARD_COLUMNS = [
     ("Agent Name", "string"),
     ("Website", "string"),
@@ -66,35 +126,26 @@ def load_jsonl(filename):
     """Load JSONL file and return list of dictionaries."""
     if not os.path.exists(filename):
         return []
-    
+
+    # Read the whole file at once and parse each line with orjson
+    with open(filename, 'rb') as f:
+        lines = f.read().splitlines()
+
     data = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    entry = json.loads(line)
-                    data.append(entry)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Skipping invalid JSON line: {e}")
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                data.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                print(f"Warning: Skipping invalid JSON line: {e}")
     return data
 
 
 def save_jsonl(filename, data):
-    """Save list of dictionaries to JSONL file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        for item in data:
-            f.write(json.dumps(item) + '\n')
-
-
-def cache_to_dict(cache_list):
-    """Convert list of cache entries to dictionary by identifier."""
-    return {entry['github_identifier']: entry for entry in cache_list}
-
-
-def dict_to_cache(cache_dict):
-    """Convert dictionary back to list of values."""
-    return list(cache_dict.values())
+    """Save list of dictionaries to JSONL file using a single buffered write."""
+    with open(filename, 'wb', buffering=1 << 20) as f:
+        f.write(b''.join(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in data))
 
 
 def normalize_date_format(date_string):
@@ -125,17 +176,90 @@ def normalize_date_format(date_string):
 # GITHUB API OPERATIONS
 # =============================================================================
 
+# Transport-level retries handled by urllib3 inside HTTP_SESSION (idempotent methods only).
+# 403/429 rate limits are left to request_with_backoff, which waits for the reset with a capped sleep.
+RETRY_ALLOWED_METHODS = frozenset(["GET", "HEAD"])
+RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
+
+
+def create_http_session():
+    """
+    Create the requests.Session shared by all worker threads.
+    Its connection pool is sized for concurrent agent and page workers (keep-alive reuse),
+    and urllib3 retries connection errors and 5xx statuses for idempotent requests.
+    Retry-After is not honoured here because urllib3 does not cap it; the exponential
+    backoff is bounded by urllib3's backoff maximum (120s).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=10,
+        backoff_factor=1.5,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+HTTP_SESSION = create_http_session()
+
+# Latest primary rate-limit state seen per X-RateLimit-Resource ("core", "search", ...)
+RATE_LIMIT_PACING_THRESHOLD = 5  # Start pacing requests when this few calls remain in the window
+GITHUB_RATE_LIMITS = {}  # {resource: (remaining, reset_ts)}
+GITHUB_RATE_LIMITS_LOCK = threading.Lock()
+
+
+def pace_rate_limit(resp):
+    """
+    Proactively pace requests against GitHub's primary rate limit.
+
+    Records X-RateLimit-Remaining / X-RateLimit-Reset per resource from a successful
+    response. Once the remaining budget drops to RATE_LIMIT_PACING_THRESHOLD, sleeps so
+    the remaining calls are spread evenly until the window resets instead of running
+    into a 403/429 mid-run.
+    """
+    try:
+        remaining = int(resp.headers['X-RateLimit-Remaining'])
+        reset_ts = int(resp.headers['X-RateLimit-Reset'])
+    except (KeyError, ValueError):
+        return
+
+    resource = resp.headers.get('X-RateLimit-Resource', 'core')
+    with GITHUB_RATE_LIMITS_LOCK:
+        # Parallel workers report out of order; keep the most pessimistic view of the current window
+        previous = GITHUB_RATE_LIMITS.get(resource)
+        if previous and previous[1] == reset_ts:
+            remaining = min(remaining, previous[0])
+        GITHUB_RATE_LIMITS[resource] = (remaining, reset_ts)
+
+    if remaining > RATE_LIMIT_PACING_THRESHOLD:
+        return
+
+    window_left = reset_ts - time.time()
+    if window_left <= 0:
+        return
+
+    wait = min(window_left / max(remaining, 1) + random.uniform(0, 0.5), 120.0)
+    print(f"GitHub {resource} rate limit: {remaining} calls left, pacing {wait:.1f}s...")
+    time.sleep(wait)
+
+
 def request_with_backoff(method, url, *, headers=None, params=None, json_body=None, data=None, max_retries=10, timeout=30):
     """
     Perform an HTTP request with exponential backoff and jitter for GitHub API.
-    Retries on 403/429 (rate limits), 5xx server errors, and transient network exceptions.
+    Retries on 403/429 (rate limits). 5xx server errors and transient network exceptions are only
+    retried here for non-idempotent methods (POST); GET/HEAD are already retried by the session's urllib3 Retry.
 
     Returns the final requests.Response on success or non-retryable status, or None after exhausting retries.
     """
     delay = 1.0
     for attempt in range(max_retries):
         try:
-            resp = requests.request(
+            resp = HTTP_SESSION.request(
                 method,
                 url,
                 headers=headers or {},
@@ -149,6 +273,12 @@ def request_with_backoff(method, url, *, headers=None, params=None, json_body=No
 
             # Success
             if 200 <= status < 300:
+                pace_rate_limit(resp)
+                return resp
+
+            # Server errors on GET/HEAD were already retried by the session's urllib3 Retry
+            if status in RETRY_STATUS_FORCELIST and method.upper() in RETRY_ALLOWED_METHODS:
+                print(f"GitHub API {status} after transport-level retries for {url}")
                 return resp
 
             # Rate limits or server errors -> retry with backoff
@@ -173,12 +303,13 @@ def request_with_backoff(method, url, *, headers=None, params=None, json_body=No
                         except Exception:
                             wait = None
 
-                # Final fallback: exponential backoff with jitter
+                # Final fallback: exponential backoff with full jitter, so parallel
+                # workers that failed together do not retry in lockstep
                 if wait is None:
-                    wait = delay + random.uniform(0, 0.5)
+                    wait = random.uniform(0, delay)
 
                 # Cap individual wait to avoid extreme sleeps
-                wait = max(1.0, min(wait, 120.0))
+                wait = min(wait, 120.0)
                 print(f"GitHub API {status}. Backing off {wait:.1f}s (attempt {attempt + 1}/{max_retries})...")
                 time.sleep(wait)
                 delay = min(delay * 2, 60.0)
@@ -188,9 +319,12 @@ def request_with_backoff(method, url, *, headers=None, params=None, json_body=No
             return resp
 
         except requests.RequestException as e:
-            # Network error -> retry with backoff
-            wait = delay + random.uniform(0, 0.5)
-            wait = max(1.0, min(wait, 60.0))
+            if method.upper() in RETRY_ALLOWED_METHODS:
+                # urllib3 Retry already retried this idempotent request; don't multiply its attempts
+                print(f"Request error after urllib3 retries: {e}")
+                return None
+            # Network error on a non-idempotent request -> retry with backoff
+            wait = min(random.uniform(0, delay), 60.0)
             print(f"Request error: {e}. Retrying in {wait:.1f}s (attempt {attempt + 1}/{max_retries})...")
             time.sleep(wait)
             delay = min(delay * 2, 60.0)
@@ -225,10 +359,302 @@ def validate_github_username(identifier):
         return False, f"Validation error: {str(e)}"
 
 
-def fetch_prs_with_time_partition(base_query, start_date, end_date, headers, prs_by_id, debug_limit=None, depth=0):
+def load_etag_cache():
+    """Load the persisted GitHub ETag cache from disk (once per process)."""
+    global GITHUB_ETAG_CACHE
+    with GITHUB_ETAG_CACHE_LOCK:
+        if GITHUB_ETAG_CACHE is None:
+            GITHUB_ETAG_CACHE = {}
+            if os.path.exists(GITHUB_ETAG_CACHE_FILE):
+                try:
+                    with open(GITHUB_ETAG_CACHE_FILE, 'r', encoding='utf-8') as f:
+                        GITHUB_ETAG_CACHE = json.load(f)
+                except Exception as e:
+                    print(f"Warning: Could not load ETag cache: {e}")
+        return GITHUB_ETAG_CACHE
+
+
+def save_etag_cache():
+    """
+    Persist the GitHub ETag cache to disk.
+    Only entries used during this run are kept, so the cache does not grow without bound.
+    """
+    global GITHUB_ETAG_CACHE
+    with GITHUB_ETAG_CACHE_LOCK:
+        if GITHUB_ETAG_CACHE is None:
+            return
+
+        GITHUB_ETAG_CACHE = {key: GITHUB_ETAG_CACHE[key] for key in GITHUB_ETAG_CACHE_USED if key in GITHUB_ETAG_CACHE}
+        GITHUB_ETAG_CACHE_USED.clear()
+
+        try:
+            temp_filename = f"{GITHUB_ETAG_CACHE_FILE}.tmp"
+            with open(temp_filename, 'w', encoding='utf-8') as f:
+                json.dump(GITHUB_ETAG_CACHE, f)
+            os.replace(temp_filename, GITHUB_ETAG_CACHE_FILE)
+            print(f"💾 Saved {len(GITHUB_ETAG_CACHE)} cached Search API pages to {GITHUB_ETAG_CACHE_FILE}")
+        except Exception as e:
+            print(f"Warning: Could not save ETag cache: {e}")
+
+
+def load_pr_density_estimates():
+    """Load the persisted per-agent PR density estimates from disk (once per process)."""
+    global PR_DENSITY_ESTIMATES
+    with PR_DENSITY_LOCK:
+        if PR_DENSITY_ESTIMATES is None:
+            PR_DENSITY_ESTIMATES = {}
+            if os.path.exists(PR_DENSITY_FILE):
+                try:
+                    with open(PR_DENSITY_FILE, 'r', encoding='utf-8') as f:
+                        PR_DENSITY_ESTIMATES = json.load(f)
+                except Exception as e:
+                    print(f"Warning: Could not load PR density estimates: {e}")
+        return PR_DENSITY_ESTIMATES
+
+
+def record_pr_density(agent_identifier, pr_count, start_date, end_date):
+    """Store the PRs/day observed for an agent over [start_date, end_date] and persist it."""
+    days = (end_date - start_date).total_seconds() / 86400
+    if days < 1:
+        return  # Too short a window for a meaningful estimate
+
+    estimates = load_pr_density_estimates()
+    with PR_DENSITY_LOCK:
+        estimates[agent_identifier] = round(pr_count / days, 3)
+        try:
+            temp_filename = f"{PR_DENSITY_FILE}.tmp"
+            with open(temp_filename, 'w', encoding='utf-8') as f:
+                json.dump(estimates, f, indent=2, sort_keys=True)
+            os.replace(temp_filename, PR_DENSITY_FILE)
+        except Exception as e:
+            print(f"Warning: Could not save PR density estimates: {e}")
+
+
+def plan_search_windows(agent_identifier, start_date, end_date):
+    """
+    Pre-split [start_date, end_date] into windows of whole calendar days sized from the agent's
+    PR density, so each window is expected to hold about PR_DENSITY_TARGET_PER_WINDOW PRs.
+    Window boundaries sit on a fixed grid of day ordinals (multiples of a power-of-two window
+    length, at most PR_DENSITY_MAX_DAYS_PER_WINDOW days), so the same windows and search
+    queries come back on every run and their ETags can be revalidated. Only the first window
+    (clamped to start_date) and the last one (ending at end_date) move between runs.
+
+    Returns:
+        List of contiguous (window_start, window_end) tuples covering 00:00:00 to 23:59:59 of their days
+    """
+    density = load_pr_density_estimates().get(agent_identifier) if agent_identifier else None
+    days_per_window = PR_DENSITY_MAX_DAYS_PER_WINDOW
+    if density:
+        # Round down to a power of two so small density drifts rarely move the grid
+        days_per_window = min(days_per_window, 1 << (max(1, int(PR_DENSITY_TARGET_PER_WINDOW / density)).bit_length() - 1))
+
+    windows = []
+    ordinal = start_date.toordinal()
+    last_ordinal = end_date.toordinal()
+    while ordinal <= last_ordinal:
+        next_ordinal = min((ordinal // days_per_window + 1) * days_per_window, last_ordinal + 1)
+        window_start = datetime.fromordinal(ordinal).replace(tzinfo=start_date.tzinfo)
+        window_end = datetime.fromordinal(next_ordinal).replace(tzinfo=start_date.tzinfo) - timedelta(seconds=1)
+        windows.append((max(window_start, start_date), min(window_end, end_date)))
+        ordinal = next_ordinal
+
+    return windows
+
+
+def trim_search_item(item):
+    """Keep only the Search API fields needed for PR metadata (keeps the ETag cache small)."""
+    return {
+        'html_url': item.get('html_url'),
+        'created_at': item.get('created_at'),
+        'closed_at': item.get('closed_at'),
+        'pull_request': {'merged_at': (item.get('pull_request') or {}).get('merged_at')}
+    }
+
+
+def search_issues_with_etag(params, headers):
+    """
+    Query the GitHub Search API using a conditional request (If-None-Match).
+    When the page is unchanged GitHub answers 304 and the cached page is returned.
+
+    Args:
+        params: Search query parameters (q, per_page, page, ...); also used as the cache key
+        headers: Request headers (authorization)
+
+    Returns:
+        Tuple (status_code, data) where data is {'total_count': int, 'items': [trimmed items]},
+        or (None, None) if retries were exhausted.
+    """
+    url = 'https://api.github.com/search/issues'
+    cache = load_etag_cache()
+    cache_key = json.dumps(params, sort_keys=True)
+
+    with GITHUB_ETAG_CACHE_LOCK:
+        cached = cache.get(cache_key)
+
+    request_headers = dict(headers or {})
+    if cached:
+        request_headers['If-None-Match'] = cached[0]
+
+    response = request_with_backoff('GET', url, headers=request_headers, params=params)
+    if response is None:
+        return None, None
+
+    # Not modified since the last run -> reuse the cached page
+    if response.status_code == 304 and cached:
+        with GITHUB_ETAG_CACHE_LOCK:
+            GITHUB_ETAG_CACHE_USED.add(cache_key)
+        return 200, cached[1]
+
+    if response.status_code != 200:
+        return response.status_code, None
+
+    data = response.json()
+    page_data = {
+        'total_count': data.get('total_count', 0),
+        'items': [trim_search_item(item) for item in data.get('items', [])]
+    }
+
+    etag = response.headers.get('ETag')
+    if etag:
+        with GITHUB_ETAG_CACHE_LOCK:
+            cache[cache_key] = [etag, page_data]
+            GITHUB_ETAG_CACHE_USED.add(cache_key)
+
+    return 200, page_data
+
+
+def fetch_search_page(query, page, per_page, headers):
+    """
+    Fetch a single page of Search API results for a query.
+
+    Returns:
+        Tuple (status_code, data) as returned by search_issues_with_etag
+    """
+    params = {
+        'q': query,
+        'per_page': per_page,
+        'page': page,
+        'sort': 'created',
+        'order': 'asc',
+        'advanced_search': 'true'  # Enables parentheses / OR between qualifiers
+    }
+
+    with SEARCH_API_SEMAPHORE:
+        return search_issues_with_etag(params, headers)
+
+
+def use_graphql_search(headers):
+    """GraphQL search is used when selected via GITHUB_SEARCH_BACKEND and a token is available."""
+    return GITHUB_SEARCH_BACKEND == 'graphql' and bool(headers and headers.get('Authorization'))
+
+
+def fetch_graphql_search_page(query, cursor, headers):
+    """
+    Fetch a single page of PR search results through the GitHub GraphQL API.
+    Nodes are mapped to the same shape as trim_search_item so both backends are interchangeable.
+
+    Args:
+        query: Search query string
+        cursor: endCursor of the previous page, or None for the first page
+        headers: Request headers (authorization)
+
+    Returns:
+        Dictionary {'total_count', 'items', 'end_cursor', 'has_next_page'}, or None on failure
+    """
+    with SEARCH_API_SEMAPHORE:
+        response = request_with_backoff(
+            'POST',
+            GITHUB_GRAPHQL_URL,
+            headers=headers,
+            json_body={'query': GRAPHQL_SEARCH_QUERY, 'variables': {'q': query, 'cursor': cursor}}
+        )
+
+    if response is None:
+        print("   GraphQL search: retries exhausted")
+        return None
+    if response.status_code != 200:
+        print(f"   GraphQL search: HTTP {response.status_code}")
+        return None
+
+    payload = response.json()
+    search = (payload.get('data') or {}).get('search')
+    if payload.get('errors') or search is None:
+        messages = '; '.join(error.get('message', '') for error in payload.get('errors') or [])
+        print(f"   GraphQL search error: {messages or 'empty response'}")
+        return None
+
+    items = [
+        {
+            'html_url': node.get('url'),
+            'created_at': node.get('createdAt'),
+            'closed_at': node.get('closedAt'),
+            'pull_request': {'merged_at': node.get('mergedAt')}
+        }
+        for node in search.get('nodes') or []
+        if node  # Non-PR results come back as empty objects
+    ]
+
+    page_info = search.get('pageInfo') or {}
+    return {
+        'total_count': search.get('issueCount', 0),
+        'items': items,
+        'end_cursor': page_info.get('endCursor'),
+        'has_next_page': page_info.get('hasNextPage', False)
+    }
+
+
+def split_time_range(start_date, end_date, depth=0):
+    """
+    Split [start_date, end_date] into non-overlapping sub-ranges for time-based partitioning.
+    Granularity follows the range length: seconds, minutes, hours, or days.
+
+    Args:
+        depth: Current recursion depth (deep recursion splits day ranges more aggressively)
+
+    Returns:
+        List of (split_start, split_end) tuples, or an empty list if the range is < 2 seconds.
+    """
+    time_diff = end_date - start_date
+    total_seconds = time_diff.total_seconds()
+
+    if total_seconds < 2:  # Less than 2 seconds - can't split further
+        return []
+
+    if total_seconds < 120:  # Less than 2 minutes - split by seconds
+        num_splits = min(4, max(2, int(total_seconds / 30)))
+        gap = timedelta(seconds=1)
+    elif total_seconds < 7200:  # Less than 2 hours - split by minutes
+        num_splits = min(4, max(2, int(total_seconds / 1800)))
+        gap = timedelta(minutes=1)
+    elif total_seconds < 172800:  # Less than 2 days - split by hours
+        num_splits = min(4, max(2, int(total_seconds / 43200)))
+        gap = timedelta(hours=1)
+    else:  # 2+ days - split by days
+        # Split into 4 parts if range is > 30 days or recursion is deep, otherwise split in half
+        num_splits = 4 if (time_diff.days > 30 or depth > 5) else 2
+        gap = timedelta(days=1)
+
+    split_duration = time_diff / num_splits
+    split_dates = [start_date + split_duration * i for i in range(num_splits)] + [end_date]
+
+    sub_ranges = []
+    for i in range(num_splits):
+        split_start = split_dates[i]
+        # Avoid overlapping ranges (add one unit of granularity to start)
+        if i > 0:
+            split_start = split_start + gap
+        sub_ranges.append((split_start, split_dates[i + 1]))
+
+    return sub_ranges
+
+
+def fetch_prs_with_time_partition(base_query, start_date, end_date, headers, prs_by_url, debug_limit=None, depth=0):
     """
     Fetch PRs within a specific time range using time-based partitioning.
-    Recursively splits the time range if hitting the 1000-result limit.
+    Recursively splits the time range as soon as page 1 reports more than 1000 results,
+    and only requests as many pages as total_count requires.
+    Pages come from the GraphQL search (cursor pagination) when use_graphql_search allows it,
+    otherwise from the REST Search API.
     Supports splitting by day, hour, minute, and second as needed.
 
     Args:
@@ -265,179 +691,127 @@ def fetch_prs_with_time_partition(base_query, start_date, end_date, headers, prs
     indent = "  " + "  " * depth
     print(f"{indent}Searching range {start_str} to {end_str}...")
 
-    page = 1
     per_page = 100
     total_in_partition = 0
 
-    while True:
-        # Check debug limit
-        if debug_limit is not None and total_in_partition >= debug_limit:
-            print(f"{indent}  🐛 DEBUG MODE: Reached limit of {debug_limit} PRs, stopping...")
-            return total_in_partition
-        url = 'https://api.github.com/search/issues'
-        params = {
-            'q': query,
-            'per_page': per_page,
-            'page': page,
-            'sort': 'created',
-            'order': 'asc'
-        }
-
-        try:
-            response = request_with_backoff('GET', url, headers=headers, params=params)
-            if response is None:
+    try:
+        # Prefer GraphQL search; fall back to the REST Search API when it is unavailable
+        data = None
+        use_graphql = use_graphql_search(headers)
+        if use_graphql:
+            data = fetch_graphql_search_page(query, None, headers)
+            if data is None:
+                print(f"{indent}  Falling back to REST search for range {start_str} to {end_str}")
+                use_graphql = False
+
+        if data is None:
+            status, data = fetch_search_page(query, 1, per_page, headers)
+            if status is None:
                 print(f"{indent}  Error: retries exhausted for range {start_str} to {end_str}")
                 return total_in_partition
 
-            if response.status_code != 200:
-                print(f"{indent}  Error: HTTP {response.status_code} for range {start_str} to {end_str}")
+            if status != 200:
+                print(f"{indent}  Error: HTTP {status} for range {start_str} to {end_str}")
                 return total_in_partition
 
-            data = response.json()
-            total_count = data.get('total_count', 0)
-            items = data.get('items', [])
-
-            if not items:
-                break
+        total_count = data.get('total_count', 0)
+
+        # Over the 1000-result limit: split the time range right away instead of
+        # paginating to page 10 first (debug runs only ever need the first page)
+        if total_count > 1000 and debug_limit is None:
+            sub_ranges = split_time_range(start_date, end_date, depth)
+            if sub_ranges:
+                print(f"{indent}  ⚠️ {total_count} results exceed the 1000-result limit. Splitting time range...")
+                total_from_splits = 0
+                for split_start, split_end in sub_ranges:
+                    total_from_splits += fetch_prs_with_time_partition(
+                        base_query, split_start, split_end, headers, prs_by_url, debug_limit, depth + 1
+                    )
+                return total_from_splits
 
-            # Add PRs to global dict
-            for pr in items:
-                pr_id = pr.get('id')
-                if pr_id and pr_id not in prs_by_id:
-                    prs_by_id[pr_id] = pr
-                    total_in_partition += 1
+            print(f"{indent}  ⚠️ Cannot split further (range < 2 seconds). Some results may be missing.")
 
-            # Check if we hit the 1000-result limit
-            if total_count > 1000 and page == 10:
-                print(f"{indent}  ⚠️ Hit 1000-result limit ({total_count} total). Splitting time range...")
+        pages = [data]
 
-                # Determine how to split based on time range duration
-                if total_seconds < 2:  # Less than 2 seconds - can't split further
-                    print(f"{indent}  ⚠️ Cannot split further (range < 2 seconds). Some results may be missing.")
+        if use_graphql:
+            # Follow endCursor; GraphQL search also stops serving results after the first 1000
+            limit = 1000 if debug_limit is None else debug_limit
+            fetched = len(data.get('items', []))
+            page_data = data
+            while page_data.get('has_next_page') and fetched < limit:
+                page_data = fetch_graphql_search_page(query, page_data.get('end_cursor'), headers)
+                if page_data is None:
+                    print(f"{indent}  Error: GraphQL pagination stopped early for range {start_str} to {end_str}")
                     break
+                pages.append(page_data)
+                fetched += len(page_data.get('items', []))
+        else:
+            # Only request the pages that actually hold results (Search API serves at most 10 pages)
+            max_page = min(10, math.ceil(total_count / per_page))
+            if debug_limit is not None:
+                max_page = min(max_page, math.ceil(debug_limit / per_page))
+
+            # total_count is known, so the remaining pages are fetched concurrently
+            if len(data.get('items', [])) == per_page and max_page > 1:
+                remaining_pages = range(2, max_page + 1)
+                with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(remaining_pages))) as executor:
+                    futures = [
+                        executor.submit(fetch_search_page, query, page, per_page, headers)
+                        for page in remaining_pages
+                    ]
+                    for page, future in zip(remaining_pages, futures):
+                        try:
+                            status, page_data = future.result()
+                        except Exception as e:
+                            # Keep page 1 and the pages that did succeed
+                            print(f"{indent}  Error fetching page {page} of range {start_str} to {end_str}: {str(e)}")
+                            continue
+                        if status != 200:
+                            print(f"{indent}  Error: {'retries exhausted' if status is None else f'HTTP {status}'} for page {page} of range {start_str} to {end_str}")
+                            continue
+                        pages.append(page_data)
+
+        # Add PRs to global dict
+        for page_data in pages:
+            for pr in page_data.get('items', []):
+                # Keyed by html_url: REST issue ids and GraphQL databaseIds are different ID spaces
+                pr_url = pr.get('html_url')
+                if pr_url and pr_url not in prs_by_url:
+                    prs_by_url[pr_url] = pr
+                    total_in_partition += 1
 
-                elif total_seconds < 120:  # Less than 2 minutes - split by seconds
-                    # Split into 2-4 parts depending on range
-                    num_splits = min(4, max(2, int(total_seconds / 30)))
-                    split_duration = time_diff / num_splits
-                    split_dates = [start_date + split_duration * i for i in range(num_splits + 1)]
-
-                    total_from_splits = 0
-                    for i in range(num_splits):
-                        split_start = split_dates[i]
-                        split_end = split_dates[i + 1]
-                        # Avoid overlapping ranges (add 1 second to start)
-                        if i > 0:
-                            split_start = split_start + timedelta(seconds=1)
-
-                        count = fetch_prs_with_time_partition(
-                            base_query, split_start, split_end, headers, prs_by_id, debug_limit, depth + 1
-                        )
-                        total_from_splits += count
-
-                    return total_from_splits
-
-                elif total_seconds < 7200:  # Less than 2 hours - split by minutes
-                    # Split into 2-4 parts
-                    num_splits = min(4, max(2, int(total_seconds / 1800)))
-                    split_duration = time_diff / num_splits
-                    split_dates = [start_date + split_duration * i for i in range(num_splits + 1)]
-
-                    total_from_splits = 0
-                    for i in range(num_splits):
-                        split_start = split_dates[i]
-                        split_end = split_dates[i + 1]
-                        # Avoid overlapping ranges (add 1 minute to start)
-                        if i > 0:
-                            split_start = split_start + timedelta(minutes=1)
-
-                        count = fetch_prs_with_time_partition(
-                            base_query, split_start, split_end, headers, prs_by_id, debug_limit, depth + 1
-                        )
-                        total_from_splits += count
-
-                    return total_from_splits
-
-                elif total_seconds < 172800:  # Less than 2 days - split by hours
-                    # Split into 2-4 parts
-                    num_splits = min(4, max(2, int(total_seconds / 43200)))
-                    split_duration = time_diff / num_splits
-                    split_dates = [start_date + split_duration * i for i in range(num_splits + 1)]
-
-                    total_from_splits = 0
-                    for i in range(num_splits):
-                        split_start = split_dates[i]
-                        split_end = split_dates[i + 1]
-                        # Avoid overlapping ranges (add 1 hour to start)
-                        if i > 0:
-                            split_start = split_start + timedelta(hours=1)
-
-                        count = fetch_prs_with_time_partition(
-                            base_query, split_start, split_end, headers, prs_by_id, debug_limit, depth + 1
-                        )
-                        total_from_splits += count
-
-                    return total_from_splits
-
-                else:  # 2+ days - split by days
-                    days_diff = time_diff.days
-
-                    # Use aggressive splitting for large ranges or deep recursion
-                    # Split into 4 parts if range is > 30 days, otherwise split in half
-                    if days_diff > 30 or depth > 5:
-                        # Split into 4 parts for more aggressive partitioning
-                        quarter_diff = time_diff / 4
-                        split_dates = [
-                            start_date,
-                            start_date + quarter_diff,
-                            start_date + quarter_diff * 2,
-                            start_date + quarter_diff * 3,
-                            end_date
-                        ]
-
-                        total_from_splits = 0
-                        for i in range(4):
-                            split_start = split_dates[i]
-                            split_end = split_dates[i + 1]
-                            # Avoid overlapping ranges
-                            if i > 0:
-                                split_start = split_start + timedelta(days=1)
-
-                            count = fetch_prs_with_time_partition(
-                                base_query, split_start, split_end, headers, prs_by_id, debug_limit, depth + 1
-                            )
-                            total_from_splits += count
-
-                        return total_from_splits
-                    else:
-                        # Binary split for smaller ranges
-                        mid_date = start_date + time_diff / 2
-
-                        # Recursively fetch both halves
-                        count1 = fetch_prs_with_time_partition(
-                            base_query, start_date, mid_date, headers, prs_by_id, debug_limit, depth + 1
-                        )
-                        count2 = fetch_prs_with_time_partition(
-                            base_query, mid_date + timedelta(days=1), end_date, headers, prs_by_id, debug_limit, depth + 1
-                        )
+    except Exception as e:
+        print(f"{indent}  Error fetching range {start_str} to {end_str}: {str(e)}")
+        return total_in_partition
 
-                        return count1 + count2
+    if total_in_partition > 0:
+        print(f"{indent}  ✓ Found {total_in_partition} PRs in range {start_str} to {end_str}")
 
-            # Normal pagination: check if there are more pages
-            if len(items) < per_page or page >= 10:
-                break
+    return total_in_partition
 
-            page += 1
-            time.sleep(0.5)  # Courtesy delay between pages
 
-        except Exception as e:
-            print(f"{indent}  Error fetching range {start_str} to {end_str}: {str(e)}")
-            return total_in_partition
+class PRMeta:
+    """
+    Minimal PR metadata record produced while mining.
+    Slots keep per-PR memory low on large runs; records only become dictionaries
+    when they are written to JSONL (see to_dict).
+    """
+    __slots__ = ('html_url', 'created_at', 'merged_at', 'closed_at')
 
-    if total_in_partition > 0:
-        print(f"{indent}  ✓ Found {total_in_partition} PRs in range {start_str} to {end_str}")
+    def __init__(self, html_url, created_at, merged_at, closed_at):
+        self.html_url = html_url
+        self.created_at = created_at
+        self.merged_at = merged_at
+        self.closed_at = closed_at
 
-    return total_in_partition
+    def to_dict(self):
+        """Return the record in the JSONL storage format."""
+        return {
+            'html_url': self.html_url,
+            'created_at': self.created_at,
+            'merged_at': self.merged_at,
+            'closed_at': self.closed_at
+        }
 
 
 def extract_pr_metadata(pr):
@@ -446,35 +820,77 @@ def extract_pr_metadata(pr):
     Only keeps essential fields: html_url, created_at, merged_at, closed_at.
     Note: agent_name is not stored as it's inferred from the folder structure.
     """
-    pull_request = pr.get('pull_request', {})
+    # Search items always carry a 'pull_request' object (see trim_search_item)
+    merged_at = pr['pull_request'].get('merged_at')
+
+    return PRMeta(
+        html_url=pr.get('html_url'),
+        created_at=pr.get('created_at'),
+        merged_at=merged_at,
+        closed_at=None if merged_at else pr.get('closed_at')  # Only store closed_at if closed but not merged
+    )
+
+
+def fetch_prs_for_query(query, start_date, end_date, headers, debug_limit=None, agent_identifier=None):
+    """
+    Fetch all PRs matching a search query within [start_date, end_date].
+    The range is pre-split into calendar-anchored windows (see plan_search_windows) that are
+    searched in parallel; the observed density is recorded afterwards.
 
-    # Extract dates
-    created_at = pr.get('created_at')
-    merged_at = pull_request.get('merged_at')
-    closed_at = pr.get('closed_at')
+    Returns:
+        Dictionary of raw PR objects keyed by html_url
+    """
+    print(f"\n🔍 Searching with query: {query}")
+    print(f"   Time range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
 
-    # Only store closed_at if PR is closed but not merged
-    if merged_at:
-        closed_at = None  # Don't store redundant info
+    query_start_time = time.time()
+    prs_by_url = {}
 
-    return {
-        'html_url': pr.get('html_url'),
-        'created_at': created_at,
-        'merged_at': merged_at,
-        'closed_at': closed_at
-    }
+    windows = [(start_date, end_date)] if debug_limit is not None else plan_search_windows(agent_identifier, start_date, end_date)
+
+    if len(windows) == 1:
+        # Fetch with time partitioning
+        fetch_prs_with_time_partition(
+            query,
+            start_date,
+            end_date,
+            headers,
+            prs_by_url,
+            debug_limit
+        )
+    else:
+        # Each window is partitioned independently into its own dict, then merged
+        print(f"   Pre-splitting into {len(windows)} calendar-anchored windows")
+        with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(windows))) as executor:
+            futures = []
+            for window_start, window_end in windows:
+                window_prs = {}
+                futures.append((window_prs, executor.submit(
+                    fetch_prs_with_time_partition, query, window_start, window_end, headers, window_prs
+                )))
+            for window_prs, future in futures:
+                future.result()
+                prs_by_url.update(window_prs)
+
+    query_duration = time.time() - query_start_time
+    print(f"   ✓ Search complete: {len(prs_by_url)} PRs found in {query_duration:.1f} seconds")
+
+    if agent_identifier and debug_limit is None:
+        record_pr_density(agent_identifier, len(prs_by_url), start_date, end_date)
+
+    return prs_by_url
 
 
-def fetch_all_prs_metadata(identifier, agent_name, token=None, start_from_date=None, reviewexclude_dates=None):
+def fetch_all_prs_metadata(identifier, agent_name, token=None, start_from_date=None, exclude_dates=None):
     """
     Fetch pull requests associated with a GitHub user or bot for the past 6 months.
     Returns lightweight metadata instead of full PR objects.
 
     This function employs time-based partitioning to navigate GitHub's 1000-result limit per query.
-    It searches using multiple query patterns:
-    - is:pr author:{identifier} (PRs authored by the bot)
-    - is:pr "co-authored-by: {identifier}" (PRs with commits co-authored by the bot)
-    - is:pr head:{identifier}/ (PRs with branch names starting with the bot identifier)
+    It searches with a single query that ORs together multiple patterns:
+    - author:{identifier} (PRs authored by the bot)
+    - "co-authored-by: {identifier}" (PRs with commits co-authored by the bot)
+    - head:{identifier}/ (PRs with branch names starting with the bot identifier)
 
     Args:
         identifier: GitHub username or bot identifier
@@ -484,33 +900,37 @@ def fetch_all_prs_metadata(identifier, agent_name, token=None, start_from_date=N
         exclude_dates: Set of date objects to exclude from mining (dates that have already been processed)
 
     Returns:
-        List of dictionaries containing minimal PR metadata
+        List of PRMeta records
     """
     headers = {'Authorization': f'token {token}'} if token else {}
 
     # Debug mode: limit PR retrieval for testing
-    debug_limit_per_pattern = 10 if DEBUG_MODE else None
+    debug_limit = 10 if DEBUG_MODE else None
 
     if DEBUG_MODE:
-        print(f"\n🐛 DEBUG MODE ENABLED: Limiting to {debug_limit_per_pattern} PRs per query pattern")
+        print(f"\n🐛 DEBUG MODE ENABLED: Limiting to {debug_limit} PRs per agent")
 
-    # Define query patterns per rules:
+    # Combine query patterns into one OR'd search so each time range is paginated once:
     # 1) author pattern only if identifier contains "[bot]"
     # 2) co-author and head patterns use identifier with "[bot]" removed
     stripped_id = identifier.replace('[bot]', '')
-    query_patterns = []
+    query_terms = []
     if '[bot]' in identifier:
-        query_patterns.append(f'is:pr author:{identifier}')
+        query_terms.append(f'author:{identifier}')
     if stripped_id:
-        query_patterns.append(f'is:pr "co-authored-by: {stripped_id}"')
-        query_patterns.append(f'is:pr head:{stripped_id}/')
+        query_terms.append(f'"co-authored-by: {stripped_id}"')
+        query_terms.append(f'head:{stripped_id}/')
 
-    # Use a dict to deduplicate PRs by ID
-    prs_by_id = {}
+    if not query_terms:
+        print(f"Warning: No search terms for identifier '{identifier}'")
+        return []
+
+    query = f'is:pr ({" OR ".join(query_terms)})'
 
     # Define time range: past 6 months only (or from start_from_date if specified)
     current_time = datetime.now(timezone.utc)
-    six_months_ago = current_time - timedelta(days=180)  # ~6 months
+    # ~6 months, anchored to midnight UTC so partition bounds (and their ETag cache keys) repeat between runs
+    six_months_ago = (current_time - timedelta(days=180)).replace(hour=0, minute=0, second=0, microsecond=0)
 
     if start_from_date:
         # Use start_from_date but ensure it's not older than 6 months
@@ -521,53 +941,24 @@ def fetch_all_prs_metadata(identifier, agent_name, token=None, start_from_date=N
     # End date is current time
     end_date = current_time
 
-    for query_pattern in query_patterns:
-        print(f"\n🔍 Searching with query: {query_pattern}")
-        print(f"   Time range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-
-        pattern_start_time = time.time()
-        initial_count = len(prs_by_id)
-
-        # Fetch with time partitioning
-        prs_found = fetch_prs_with_time_partition(
-            query_pattern,
-            start_date,
-            end_date,
-            headers,
-            prs_by_id,
-            debug_limit_per_pattern
-        )
-
-        pattern_duration = time.time() - pattern_start_time
-        new_prs = len(prs_by_id) - initial_count
-
-        print(f"   ✓ Pattern complete: {new_prs} new PRs found ({prs_found} total fetched, {len(prs_by_id) - initial_count - (prs_found - new_prs)} duplicates)")
-        print(f"   ⏱️ Time taken: {pattern_duration:.1f} seconds")
-
-        # Delay between different query patterns (shorter in debug mode)
-        time.sleep(0.2 if DEBUG_MODE else 1.0)
+    # Use a dict to deduplicate PRs by html_url
+    prs_by_url = fetch_prs_for_query(query, start_date, end_date, headers, debug_limit, identifier)
 
     # Convert to lightweight metadata
-    all_prs = list(prs_by_id.values())
+    all_prs = list(prs_by_url.values())
 
     # Filter out PRs from excluded dates if specified
     if exclude_dates:
+        # Compare YYYY-MM-DD prefixes of created_at instead of parsing every timestamp
+        excluded_days = {d.isoformat() for d in exclude_dates}
         filtered_prs = []
         excluded_count = 0
         for pr in all_prs:
             created_at = pr.get('created_at')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    pr_date = dt.date()
-                    if pr_date not in exclude_dates:
-                        filtered_prs.append(pr)
-                    else:
-                        excluded_count += 1
-                except Exception:
-                    filtered_prs.append(pr)  # Keep PRs with unparseable dates
+            if created_at and created_at[:10] in excluded_days:
+                excluded_count += 1
             else:
-                filtered_prs.append(pr)  # Keep PRs without created_at
+                filtered_prs.append(pr)  # Keep PRs from other dates or without created_at
 
         if excluded_count > 0:
             print(f"   ⏭️ Skipped {excluded_count} PRs from already-mined dates")
@@ -582,14 +973,6 @@ def fetch_all_prs_metadata(identifier, agent_name, token=None, start_from_date=N
 
     metadata_list = [extract_pr_metadata(pr) for pr in all_prs]
 
-    # Calculate memory savings
-    import sys
-    original_size = sys.getsizeof(str(all_prs))
-    metadata_size = sys.getsizeof(str(metadata_list))
-    savings_pct = ((original_size - metadata_size) / original_size * 100) if original_size > 0 else 0
-
-    print(f"💾 Memory efficiency: {original_size // 1024}KB → {metadata_size // 1024}KB (saved {savings_pct:.1f}%)")
-
     return metadata_list
 
 
@@ -625,6 +1008,47 @@ def calculate_pr_stats_from_metadata(metadata_list):
     }
 
 
+def calculate_pr_stats_by_agent(all_metadata):
+    """
+    Calculate PR statistics for every agent in a single vectorized pandas pass.
+    Uses the same definitions as calculate_pr_stats_from_metadata, grouped by agent_identifier.
+
+    Args:
+        all_metadata: List of PR metadata dictionaries with 'agent_identifier' set
+
+    Returns:
+        dict: {agent_identifier: {'total_prs', 'merged_prs', 'acceptance_rate'}}
+    """
+    if not all_metadata:
+        return {}
+
+    df = pd.DataFrame.from_records(
+        all_metadata,
+        columns=['agent_identifier', 'html_url', 'merged_at', 'closed_at']
+    )
+
+    # Match the truthiness checks used for single-agent stats (None / '' count as missing)
+    merged = df['merged_at'].fillna('').astype(bool)
+    closed = df['closed_at'].fillna('').astype(bool)
+
+    stats = df.assign(
+        merged=merged,
+        closed_not_merged=closed & ~merged
+    ).groupby('agent_identifier').agg(
+        total_prs=('html_url', 'size'),
+        merged_prs=('merged', 'sum'),
+        closed_not_merged=('closed_not_merged', 'sum')
+    )
+
+    # Acceptance rate over decided PRs only (merged + closed but not merged)
+    total_decisions = stats['merged_prs'] + stats['closed_not_merged']
+    stats['acceptance_rate'] = (
+        stats['merged_prs'] / total_decisions.where(total_decisions > 0) * 100
+    ).fillna(0).round(2)
+
+    return stats[['total_prs', 'merged_prs', 'acceptance_rate']].to_dict('index')
+
+
 def calculate_monthly_metrics_by_agent():
     """
     Calculate monthly metrics for all agents for visualization.
@@ -669,13 +1093,9 @@ def calculate_monthly_metrics_by_agent():
         # Get agent_name from identifier
         agent_name = identifier_to_name.get(agent_identifier, agent_identifier)
 
-        try:
-            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            month_key = f"{dt.year}-{dt.month:02d}"
-            agent_month_data[agent_name][month_key].append(pr_meta)
-        except Exception as e:
-            print(f"Warning: Could not parse date '{created_at}': {e}")
-            continue
+        # YYYY-MM prefix of the fixed-shape GitHub timestamp
+        month_key = created_at[:7]
+        agent_month_data[agent_name][month_key].append(pr_meta)
 
     # Get all unique months and sort them
     all_months = set()
@@ -732,46 +1152,114 @@ def calculate_monthly_metrics_by_agent():
 # PR METADATA STORAGE & RETRIEVAL
 # =============================================================================
 
+def list_pr_metadata_files():
+    """
+    List all files in PR_METADATA_REPO.
+    Not cached: readers must see day files written by other processes (e.g. msr.py).
+    A mining run lists once and passes the result down through the files argument.
+
+    Returns:
+        List of file paths in the repository
+    """
+    api = HfApi()
+    return api.list_repo_files(repo_id=PR_METADATA_REPO, repo_type="dataset")
+
+
 def group_metadata_by_date(metadata_list):
     """
-    Group PR metadata by exact date (year.month.day) for efficient daily storage.
+    Group PRMeta records by exact date (year.month.day) for efficient daily storage.
     Returns dict: {(year, month, day): [metadata_list]}
     """
     grouped = defaultdict(list)
 
     for pr_meta in metadata_list:
-        created_at = pr_meta.get('created_at')
+        created_at = pr_meta.created_at
         if not created_at:
             continue
 
+        # GitHub timestamps have the fixed shape YYYY-MM-DDTHH:MM:SSZ,
+        # so the date can be sliced out without full datetime parsing
         try:
-            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            key = (dt.year, dt.month, dt.day)
+            key = (int(created_at[0:4]), int(created_at[5:7]), int(created_at[8:10]))
             grouped[key].append(pr_meta)
-        except Exception as e:
+        except ValueError as e:
             print(f"Warning: Could not parse date '{created_at}': {e}")
 
     return dict(grouped)
 
 
-def save_pr_metadata_to_hf(metadata_list, agent_identifier):
+def merge_day_file(local_path, day_metadata):
+    """
+    Merge new PR metadata into a local day file, deduplicating by html_url.
+
+    PRs not yet in the file are appended; the file is only rewritten when an
+    already stored PR changed (e.g. it was merged or closed since last mined).
+
+    Args:
+        local_path: Path of the local YYYY.MM.DD.jsonl file
+        day_metadata: List of PRMeta records created on that day
+
+    Returns:
+        True if the file on disk was modified, False otherwise
+    """
+    new_by_url = {meta.html_url: meta.to_dict() for meta in day_metadata if meta.html_url}
+    if not new_by_url:
+        return False
+
+    existing_by_url = {meta['html_url']: meta for meta in load_jsonl(local_path) if meta.get('html_url')}
+
+    appended = [meta for url, meta in new_by_url.items() if url not in existing_by_url]
+    updated = any(url in existing_by_url and existing_by_url[url] != meta for url, meta in new_by_url.items())
+
+    if updated:
+        # New data overwrites old, so the whole day has to be rewritten
+        existing_by_url.update(new_by_url)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        save_jsonl(local_path, existing_by_url.values())
+        return True
+
+    if appended:
+        # Older files may lack a trailing newline before the appended rows
+        prefix = b''
+        if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+            with open(local_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    prefix = b'\n'
+
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        with open(local_path, 'ab') as f:
+            f.write(prefix + b''.join(orjson.dumps(meta, option=orjson.OPT_APPEND_NEWLINE) for meta in appended))
+        return True
+
+    return False
+
+
+def save_pr_metadata_to_hf(metadata_list, agent_identifier, operations=None, files=None):
     """
     Save PR metadata to HuggingFace dataset, organized by [agent_identifier]/YYYY.MM.DD.jsonl.
     Each file is stored in the agent's folder and named YYYY.MM.DD.jsonl for that day's PRs.
     In debug mode, saves to in-memory cache only.
 
     This function APPENDS new metadata and DEDUPLICATES by html_url.
+    Day files are kept in a local mirror (PR_METADATA_LOCAL_DIR), and only the files that
+    actually changed are pushed back. With a repo listing (files), only the touched day files
+    that already exist are downloaded; without one, a snapshot_download syncs the touched months.
+    When an operations list is given, the changed files are queued on it so the caller
+    can push a whole run in one commit; otherwise they are committed right away.
 
     Args:
-        metadata_list: List of PR metadata dictionaries
+        metadata_list: List of PRMeta records
         agent_identifier: GitHub identifier of the agent (used as folder name)
+        operations: Optional list collecting CommitOperationAdd entries across agents
+        files: Optional pre-fetched list of files in PR_METADATA_REPO
     """
     # Skip saving to HF in debug mode - use in-memory cache instead
     if DEBUG_MODE:
         global DEBUG_PR_METADATA_CACHE
         # Merge with existing cache, deduplicating by html_url
         existing = {pr['html_url']: pr for pr in DEBUG_PR_METADATA_CACHE[agent_identifier] if pr.get('html_url')}
-        new = {pr['html_url']: pr for pr in metadata_list if pr.get('html_url')}
+        new = {pr.html_url: pr.to_dict() for pr in metadata_list if pr.html_url}
         existing.update(new)
         DEBUG_PR_METADATA_CACHE[agent_identifier] = list(existing.values())
         print(f"🐛 DEBUG MODE: Saved to in-memory cache only ({len(metadata_list)} PRs) - NOT saved to HuggingFace")
@@ -782,57 +1270,78 @@ def save_pr_metadata_to_hf(metadata_list, agent_identifier):
         if not token:
             raise Exception("No HuggingFace token found")
 
-        api = HfApi()
-
         # Group by exact date (year, month, day)
         grouped = group_metadata_by_date(metadata_list)
 
-        for (pr_year, month, day), day_metadata in grouped.items():
-            # New structure: [agent_identifier]/YYYY.MM.DD.jsonl
-            filename = f"{agent_identifier}/{pr_year}.{month:02d}.{day:02d}.jsonl"
-            local_filename = f"{pr_year}.{month:02d}.{day:02d}.jsonl"
-            print(f"📤 Uploading {len(day_metadata)} PRs to {filename}...")
+        # New structure: [agent_identifier]/YYYY.MM.DD.jsonl
+        day_files = {
+            (pr_year, month, day): f"{agent_identifier}/{pr_year}.{month:02d}.{day:02d}.jsonl"
+            for (pr_year, month, day) in grouped
+        }
 
-            # Download existing file if it exists
-            existing_metadata = []
-            try:
-                file_path = hf_hub_download(
+        if files is not None:
+            # The run's listing tells which touched day files exist, so fetch just those
+            # (up-to-date copies in the local mirror are not downloaded again); new days start empty
+            known_files = set(files)
+            existing_files = [filename for filename in day_files.values() if filename in known_files]
+            print(f"📥 Syncing {len(existing_files)} existing day files for {agent_identifier} ({len(day_files)} days)...")
+            for filename in existing_files:
+                with HF_API_SEMAPHORE:
+                    hf_hub_download(
+                        repo_id=PR_METADATA_REPO,
+                        filename=filename,
+                        repo_type="dataset",
+                        local_dir=PR_METADATA_LOCAL_DIR,
+                        token=token
+                    )
+        else:
+            # No listing at hand: sync the months we are about to touch in one batched transfer.
+            # snapshot_download lists the whole repo on every call, which is why mining runs pass
+            # their single listing instead. One wildcard per month keeps pattern matching cheap
+            # (identifiers like "name[bot]" are escaped so brackets are not treated as glob classes)
+            month_patterns = sorted({f"{glob.escape(agent_identifier)}/{pr_year}.{month:02d}.*.jsonl" for (pr_year, month, _) in grouped})
+            print(f"📥 Syncing existing day files for {agent_identifier} ({len(day_files)} days)...")
+            with HF_API_SEMAPHORE:
+                snapshot_download(
                     repo_id=PR_METADATA_REPO,
-                    filename=filename,
                     repo_type="dataset",
+                    allow_patterns=month_patterns,
+                    local_dir=PR_METADATA_LOCAL_DIR,
                     token=token
                 )
-                existing_metadata = load_jsonl(file_path)
-                print(f"   Found {len(existing_metadata)} existing PRs in {filename}")
-            except Exception:
-                print(f"   No existing file found for {filename}, creating new")
 
-            # Merge and deduplicate by html_url
-            existing_by_url = {meta['html_url']: meta for meta in existing_metadata if meta.get('html_url')}
-            new_by_url = {meta['html_url']: meta for meta in day_metadata if meta.get('html_url')}
+        # Merge new metadata into the local day files, keeping track of which ones changed
+        changed_files = []
+        for key, day_metadata in grouped.items():
+            filename = day_files[key]
+            if merge_day_file(os.path.join(PR_METADATA_LOCAL_DIR, filename), day_metadata):
+                changed_files.append(filename)
 
-            # Update with new data (new data overwrites old)
-            existing_by_url.update(new_by_url)
-            merged_metadata = list(existing_by_url.values())
+        if not changed_files:
+            print(f"   ✓ No changes for {agent_identifier}, skipping upload")
+            return True
 
-            # Save locally
-            save_jsonl(local_filename, merged_metadata)
+        commit_operations = [
+            CommitOperationAdd(path_in_repo=filename, path_or_fileobj=os.path.join(PR_METADATA_LOCAL_DIR, filename))
+            for filename in changed_files
+        ]
 
-            try:
-                # Upload to HuggingFace with folder path
-                upload_with_retry(
-                    api=api,
-                    path_or_fileobj=local_filename,
-                    path_in_repo=filename,
-                    repo_id=PR_METADATA_REPO,
-                    repo_type="dataset",
-                    token=token
-                )
-                print(f"   ✓ Saved {len(merged_metadata)} total PRs to {filename}")
-            finally:
-                # Always clean up local file, even if upload fails
-                if os.path.exists(local_filename):
-                    os.remove(local_filename)
+        if operations is not None:
+            # Queued for the run-wide commit (list.extend is atomic across worker threads)
+            operations.extend(commit_operations)
+            print(f"   ✓ Queued {len(changed_files)}/{len(day_files)} changed day files for {agent_identifier}")
+        else:
+            # Upload only the changed day files in a single commit
+            print(f"📤 Uploading {len(changed_files)}/{len(day_files)} changed day files to {agent_identifier}/...")
+            create_commit_with_retry(
+                api=HfApi(),
+                operations=commit_operations,
+                commit_message=f"Update PR metadata for {agent_identifier}",
+                repo_id=PR_METADATA_REPO,
+                repo_type="dataset",
+                token=token
+            )
+            print(f"   ✓ Saved {len(metadata_list)} PRs across {len(changed_files)} changed day files for {agent_identifier}")
 
         return True
 
@@ -841,13 +1350,16 @@ def save_pr_metadata_to_hf(metadata_list, agent_identifier):
         return False
 
 
-def load_pr_metadata():
+def load_pr_metadata(files=None):
     """
     Loads PR metadata from the last LEADERBOARD_TIME_FRAME_DAYS only.
     In debug mode, loads from in-memory cache if available.
 
     Structure: [agent_identifier]/YYYY.MM.DD.jsonl
 
+    Args:
+        files: Optional pre-fetched list of files in PR_METADATA_REPO
+
     Returns:
         List of dictionaries with 'agent_identifier' added to each PR metadata.
         Only includes PRs within the last LEADERBOARD_TIME_FRAME_DAYS.
@@ -856,35 +1368,31 @@ def load_pr_metadata():
     if DEBUG_MODE and DEBUG_PR_METADATA_CACHE:
         all_metadata = []
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=LEADERBOARD_TIME_FRAME_DAYS)
+        cutoff_str = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
 
         for agent_identifier, metadata_list in DEBUG_PR_METADATA_CACHE.items():
             for pr_meta in metadata_list:
-                # Filter by created_at date
+                # Filter by created_at date (ISO timestamps compare chronologically as strings)
                 created_at = pr_meta.get('created_at')
-                if created_at:
-                    try:
-                        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        if dt >= cutoff_date:
-                            pr_with_agent = pr_meta.copy()
-                            pr_with_agent['agent_identifier'] = agent_identifier
-                            all_metadata.append(pr_with_agent)
-                    except Exception:
-                        # If date parsing fails, skip this PR
-                        continue
+                if created_at and created_at >= cutoff_str:
+                    pr_with_agent = pr_meta.copy()
+                    pr_with_agent['agent_identifier'] = agent_identifier
+                    all_metadata.append(pr_with_agent)
 
         if all_metadata:
             print(f"🐛 DEBUG MODE: Loading PR metadata from in-memory cache ({len(all_metadata)} PRs from last {LEADERBOARD_TIME_FRAME_DAYS} days)")
             return all_metadata
 
     try:
-        api = HfApi()
         token = get_hf_token()
 
         # Calculate cutoff date for filtering
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=LEADERBOARD_TIME_FRAME_DAYS)
+        cutoff_str = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
 
         # List all files in the repository
-        files = api.list_repo_files(repo_id=PR_METADATA_REPO, repo_type="dataset")
+        if files is None:
+            files = list_pr_metadata_files()
 
         # Filter for files within the time frame: [agent_identifier]/YYYY.MM.DD.jsonl
         # Parse date from filename and only include files within LEADERBOARD_TIME_FRAME_DAYS
@@ -911,6 +1419,26 @@ def load_pr_metadata():
 
         print(f"📥 Loading PR metadata from last {LEADERBOARD_TIME_FRAME_DAYS} days ({len(relevant_files)} daily files across all agents)...")
 
+        if not relevant_files:
+            return []
+
+        # Download all relevant daily files in one batched transfer; files already in the
+        # local HuggingFace cache are not re-downloaded. huggingface_hub matches every repo file
+        # against every pattern, so use one month-prefix wildcard per month (e.g. "*/2025.05.*.jsonl")
+        # rather than one pattern per file; the cutoff is applied on the Python side below
+        month_patterns = sorted({f"*/{filename.split('/')[1][:8]}*.jsonl" for filename in relevant_files})
+        try:
+            snapshot_path = snapshot_download(
+                repo_id=PR_METADATA_REPO,
+                repo_type="dataset",
+                allow_patterns=month_patterns,
+                token=token
+            )
+        except Exception as e:
+            # Don't let one failed batch blank the leaderboard: fetch files one by one below
+            print(f"   Warning: Batched download failed ({str(e)}), downloading daily files individually...")
+            snapshot_path = None
+
         all_metadata = []
         for filename in relevant_files:
             try:
@@ -923,31 +1451,25 @@ def load_pr_metadata():
 
                 agent_identifier = parts[0]
 
-                file_path = hf_hub_download(
-                    repo_id=PR_METADATA_REPO,
-                    filename=filename,
-                    repo_type="dataset",
-                    token=token
-                )
+                if snapshot_path:
+                    file_path = os.path.join(snapshot_path, filename)
+                else:
+                    file_path = hf_hub_download(
+                        repo_id=PR_METADATA_REPO,
+                        filename=filename,
+                        repo_type="dataset",
+                        token=token
+                    )
                 day_metadata = load_jsonl(file_path)
 
                 # Filter individual PRs by created_at date as a double-check
+                # (ISO timestamps compare chronologically as strings; PRs without created_at are skipped)
                 for pr_meta in day_metadata:
                     created_at = pr_meta.get('created_at')
-                    if created_at:
-                        try:
-                            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            if dt >= cutoff_date:
-                                pr_meta['agent_identifier'] = agent_identifier
-                                all_metadata.append(pr_meta)
-                        except Exception:
-                            # If date parsing fails, skip this PR
-                            continue
-                    else:
-                        # If no created_at, skip this PR
-                        continue
+                    if created_at and created_at >= cutoff_str:
+                        pr_meta['agent_identifier'] = agent_identifier
+                        all_metadata.append(pr_meta)
 
-                print(f"   ✓ Loaded PRs from {filename}")
             except Exception as e:
                 print(f"   Warning: Could not load {filename}: {str(e)}")
 
@@ -959,25 +1481,63 @@ def load_pr_metadata():
         return []
 
 
-def get_latest_pr_date_for_agent(agent_identifier):
+def commit_pr_metadata_operations(operations):
+    """
+    Push every day file queued during a mining run to PR_METADATA_REPO as a single commit.
+
+    Args:
+        operations: List of CommitOperationAdd entries queued by save_pr_metadata_to_hf
+
+    Returns:
+        True if the commit succeeded or there was nothing to upload, False otherwise
+    """
+    if not operations:
+        print("✓ No PR metadata changes to upload")
+        return True
+
+    try:
+        token = get_hf_token()
+        if not token:
+            raise Exception("No HuggingFace token found")
+
+        print(f"📤 Uploading {len(operations)} changed day files to {PR_METADATA_REPO} in one commit...")
+        create_commit_with_retry(
+            api=HfApi(),
+            operations=operations,
+            commit_message=f"Mine PR metadata {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            repo_id=PR_METADATA_REPO,
+            repo_type="dataset",
+            token=token
+        )
+        print(f"✓ Committed {len(operations)} day files to {PR_METADATA_REPO}")
+        return True
+
+    except Exception as e:
+        print(f"✗ Error committing PR metadata: {str(e)}")
+        return False
+
+
+def get_latest_pr_date_for_agent(agent_identifier, files=None):
     """
     Get the latest PR creation date for an agent from stored metadata.
-    Used for incremental updates - only fetch PRs newer than this date.
+    Intended for incremental updates (fetch_all_prs_metadata's start_from_date); note that
+    the current mining path has no caller, since process_one_agent re-mines the full window.
 
     Structure: [agent_identifier]/YYYY.MM.DD.jsonl
 
+    The newest day is derived from the filenames alone and only that single day file is
+    downloaded to resolve the exact timestamp.
+
     Args:
         agent_identifier: GitHub identifier of the agent
+        files: Optional pre-fetched list of files in PR_METADATA_REPO
 
     Returns:
         datetime or None if no existing PRs found.
     """
     try:
-        api = HfApi()
-        token = get_hf_token()
-
-        # List all files in the repository
-        files = api.list_repo_files(repo_id=PR_METADATA_REPO, repo_type="dataset")
+        if files is None:
+            files = list_pr_metadata_files()
 
         # Filter for files in this agent's folder
         # New structure: [agent_identifier]/YYYY.MM.DD.jsonl
@@ -987,29 +1547,26 @@ def get_latest_pr_date_for_agent(agent_identifier):
         if not agent_files:
             return None
 
-        # Find latest created_at across all files
-        latest_date = None
-        for filename in agent_files:
-            try:
-                file_path = hf_hub_download(
-                    repo_id=PR_METADATA_REPO,
-                    filename=filename,
-                    repo_type="dataset",
-                    token=token
-                )
-                metadata = load_jsonl(file_path)
+        # Zero-padded YYYY.MM.DD filenames sort chronologically
+        latest_file = max(agent_files)
+        date_part = latest_file[len(agent_pattern):].replace('.jsonl', '')
+        file_year, file_month, file_day = map(int, date_part.split('.'))
+        latest_date = datetime(file_year, file_month, file_day, tzinfo=timezone.utc)
 
-                for pr in metadata:
-                    created_at = pr.get('created_at')
-                    if created_at:
-                        try:
-                            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            if latest_date is None or dt > latest_date:
-                                latest_date = dt
-                        except Exception:
-                            continue
-            except Exception:
-                continue
+        # Refine to the exact latest created_at within that day
+        try:
+            file_path = hf_hub_download(
+                repo_id=PR_METADATA_REPO,
+                filename=latest_file,
+                repo_type="dataset",
+                token=get_hf_token()
+            )
+            created_dates = [pr['created_at'] for pr in load_jsonl(file_path) if pr.get('created_at')]
+            if created_dates:
+                # ISO timestamps compare chronologically as strings; parse only the winner
+                latest_date = max(latest_date, datetime.fromisoformat(max(created_dates).replace('Z', '+00:00')))
+        except Exception:
+            pass
 
         return latest_date
 
@@ -1017,27 +1574,26 @@ def get_latest_pr_date_for_agent(agent_identifier):
         return None
 
 
-def get_daily_files_last_n_months(agent_identifier, n_months=6):
+def get_daily_files_last_n_months(agent_identifier, n_months=6, files=None):
     """
     Get list of daily file paths for an agent from the last N months.
 
     Args:
         agent_identifier: GitHub identifier of the agent
         n_months: Number of months to look back (default: 6)
+        files: Optional pre-fetched list of files in PR_METADATA_REPO
 
     Returns:
         List of file paths in format: [agent_identifier]/YYYY.MM.DD.jsonl
     """
     try:
-        api = HfApi()
-        token = get_hf_token()
-
         # Calculate date range
         today = datetime.now(timezone.utc)
         n_months_ago = today - timedelta(days=30 * n_months)
 
         # List all files in the repository
-        files = api.list_repo_files(repo_id=PR_METADATA_REPO, repo_type="dataset")
+        if files is None:
+            files = list_pr_metadata_files()
 
         # Filter for files in this agent's folder
         agent_pattern = f"{agent_identifier}/"
@@ -1073,26 +1629,26 @@ def get_daily_files_last_n_months(agent_identifier, n_months=6):
         return []
 
 
-def get_already_mined_dates(agent_identifier, n_months=6):
+def get_already_mined_dates(agent_identifier, n_months=6, files=None):
     """
     Get set of dates that have already been mined for an agent.
 
     Args:
         agent_identifier: GitHub identifier of the agent
         n_months: Number of months to look back (default: 6)
+        files: Optional pre-fetched list of files in PR_METADATA_REPO
 
     Returns:
         Set of date objects (datetime.date) that already have data files
     """
     try:
-        api = HfApi()
-
         # Calculate date range
         today = datetime.now(timezone.utc)
         n_months_ago = today - timedelta(days=30 * n_months)
 
         # List all files in the repository
-        files = api.list_repo_files(repo_id=PR_METADATA_REPO, repo_type="dataset")
+        if files is None:
+            files = list_pr_metadata_files()
 
         # Filter for files in this agent's folder
         agent_pattern = f"{agent_identifier}/"
@@ -1294,35 +1850,59 @@ def refresh_open_prs_for_agent(agent_identifier, token):
 # HUGGINGFACE DATASET OPERATIONS
 # =============================================================================
 
+def get_agents_snapshot_path():
+    """
+    Return the local snapshot folder holding all agent JSON files of AGENTS_REPO.
+
+    While the last revalidation is younger than AGENTS_CACHE_TTL_SECONDS the snapshot is
+    served from the HuggingFace cache without any network call. Otherwise a single
+    snapshot_download resolves the current revision and fetches only changed files.
+    """
+    stamp_fresh = (
+        os.path.exists(AGENTS_CACHE_STAMP_FILE)
+        and time.time() - os.path.getmtime(AGENTS_CACHE_STAMP_FILE) < AGENTS_CACHE_TTL_SECONDS
+    )
+    if stamp_fresh:
+        try:
+            return snapshot_download(
+                repo_id=AGENTS_REPO,
+                repo_type="dataset",
+                allow_patterns="*.json",
+                local_files_only=True
+            )
+        except LocalEntryNotFoundError:
+            pass
+
+    snapshot_path = snapshot_download(
+        repo_id=AGENTS_REPO,
+        repo_type="dataset",
+        allow_patterns="*.json"
+    )
+    with open(AGENTS_CACHE_STAMP_FILE, 'w') as f:
+        f.write(datetime.now(timezone.utc).isoformat())
+    return snapshot_path
+
+
 def load_agents_from_hf():
     """Load all agent metadata JSON files from HuggingFace dataset."""
     try:
-        api = HfApi()
         agents = []
 
-        # List all files in the repository
-        files = api.list_repo_files(repo_id=AGENTS_REPO, repo_type="dataset")
-
-        # Filter for JSON files only
-        json_files = [f for f in files if f.endswith('.json')]
+        # Resolve all agent files in one batched snapshot instead of one download per file
+        snapshot_path = get_agents_snapshot_path()
+        json_files = sorted(glob.glob(os.path.join(glob.escape(snapshot_path), '**', '*.json'), recursive=True))
 
         print(f"Found {len(json_files)} agent files in {AGENTS_REPO}")
 
-        # Download and parse each JSON file
-        for json_file in json_files:
+        # Parse each JSON file
+        for file_path in json_files:
             try:
-                file_path = hf_hub_download(
-                    repo_id=AGENTS_REPO,
-                    filename=json_file,
-                    repo_type="dataset"
-                )
-
                 with open(file_path, 'r') as f:
                     agent_data = json.load(f)
                     agents.append(agent_data)
 
             except Exception as e:
-                print(f"Warning: Could not load {json_file}: {str(e)}")
+                print(f"Warning: Could not load {os.path.basename(file_path)}: {str(e)}")
                 continue
 
         print(f"✓ Loaded {len(agents)} agents from HuggingFace")
@@ -1363,13 +1943,59 @@ def upload_with_retry(api, path_or_fileobj, path_in_repo, repo_id, repo_type, to
 
     for attempt in range(max_retries):
         try:
-            api.upload_file(
-                path_or_fileobj=path_or_fileobj,
-                path_in_repo=path_in_repo,
-                repo_id=repo_id,
-                repo_type=repo_type,
-                token=token
-            )
+            with HF_API_SEMAPHORE:
+                api.upload_file(
+                    path_or_fileobj=path_or_fileobj,
+                    path_in_repo=path_in_repo,
+                    repo_id=repo_id,
+                    repo_type=repo_type,
+                    token=token
+                )
+            if attempt > 0:
+                print(f"   ✓ Upload succeeded on attempt {attempt + 1}/{max_retries}")
+            return True
+
+        except Exception as e:
+            if attempt < max_retries - 1:
+                wait_time = delay + random.uniform(0, 1.0)
+                print(f"   ⚠️ Upload failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                print(f"   ⏳ Retrying in {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+                delay = min(delay * 2, 60.0)  # Exponential backoff, max 60s
+            else:
+                print(f"   ✗ Upload failed after {max_retries} attempts: {str(e)}")
+                raise
+
+
+def create_commit_with_retry(api, operations, commit_message, repo_id, repo_type, token, max_retries=5):
+    """
+    Push a list of commit operations to HuggingFace as a single commit,
+    with exponential backoff retry logic.
+
+    Args:
+        api: HfApi instance
+        operations: List of CommitOperationAdd entries
+        commit_message: Commit message
+        repo_id: Repository ID
+        repo_type: Type of repository (e.g., "dataset")
+        token: HuggingFace token
+        max_retries: Maximum number of retry attempts
+
+    Returns:
+        True if the commit succeeded, raises exception if all retries failed
+    """
+    delay = 2.0  # Initial delay in seconds
+
+    for attempt in range(max_retries):
+        try:
+            with HF_API_SEMAPHORE:
+                api.create_commit(
+                    repo_id=repo_id,
+                    repo_type=repo_type,
+                    operations=operations,
+                    commit_message=commit_message,
+                    token=token
+                )
             if attempt > 0:
                 print(f"   ✓ Upload succeeded on attempt {attempt + 1}/{max_retries}")
             return True
@@ -1413,6 +2039,10 @@ def save_agent_to_hf(data):
                 token=token
             )
             print(f"✓ Saved agent to HuggingFace: {filename}")
+
+            # Force the next load_agents_from_hf to revalidate against the Hub
+            if os.path.exists(AGENTS_CACHE_STAMP_FILE):
+                os.remove(AGENTS_CACHE_STAMP_FILE)
             return True
         finally:
             # Always clean up local file, even if upload fails
@@ -1430,6 +2060,69 @@ def save_agent_to_hf(data):
 # DATA MANAGEMENT
 # =============================================================================
 
+def process_one_agent(agent, token, pr_metadata_files=None, operations=None):
+    """
+    Mine and save PR metadata for a single agent.
+    Safe to run concurrently for different agents.
+
+    Args:
+        agent: Agent metadata dictionary loaded from HuggingFace
+        token: GitHub API token
+        pr_metadata_files: Optional pre-fetched list of files in PR_METADATA_REPO
+        operations: Optional list collecting the run's CommitOperationAdd entries
+
+    Returns:
+        True if the agent was processed successfully, False otherwise
+    """
+    identifier = agent.get('github_identifier')
+    agent_name = agent.get('agent_name', 'Unknown')
+
+    try:
+        print(f"\n{'='*80}")
+        print(f"Processing: {agent_name} ({identifier})")
+        print(f"{'='*80}")
+
+        # Get already-mined dates for this agent (last 6 months)
+        already_mined_dates = get_already_mined_dates(identifier, n_months=6, files=pr_metadata_files)
+
+        if already_mined_dates:
+            print(f"📅 [{identifier}] Found {len(already_mined_dates)} already-mined dates")
+            print(f"   Re-mining ALL dates (including existing) to update metadata...")
+            # Re-mine ALL PRs (do NOT exclude already-mined dates)
+            # This ensures metadata like merged_at is updated even if day file exists
+            new_metadata = fetch_all_prs_metadata(
+                identifier,
+                agent_name,
+                token,
+                start_from_date=None,  # Use full 6-month range
+                exclude_dates=None  # Re-mine ALL dates (no exclusions)
+            )
+        else:
+            print(f"📅 [{identifier}] No existing data found. Mining everything from scratch...")
+            # Mine everything from scratch (full 6-month range)
+            new_metadata = fetch_all_prs_metadata(
+                identifier,
+                agent_name,
+                token,
+                start_from_date=None
+            )
+
+        if new_metadata:
+            # Save new metadata to HuggingFace (organized by agent_identifier/YYYY.MM.DD.jsonl)
+            print(f"💾 [{identifier}] Saving {len(new_metadata)} new PR records...")
+            save_pr_metadata_to_hf(new_metadata, identifier, operations, pr_metadata_files)
+        else:
+            print(f"   [{identifier}] No new PRs to save")
+
+        return True
+
+    except Exception as e:
+        print(f"✗ Error updating {identifier}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def update_all_agents_incremental():
     """
     Memory-efficient incremental update of PR statistics for all agents.
@@ -1442,6 +2135,9 @@ def update_all_agents_incremental():
     5. Store minimal metadata (not full PR objects) to avoid storage limits
     6. Construct leaderboard from ALL stored metadata (last 6 months)
 
+    Agents are mined concurrently in a bounded thread pool (MAX_AGENT_WORKERS);
+    statistics are calculated once all agents have been saved.
+
     Returns dictionary of all agent data with current stats.
     """
     token = get_github_token()
@@ -1452,79 +2148,57 @@ def update_all_agents_incremental():
         print("No agents found in HuggingFace dataset")
         return {}
 
-    cache_dict = {}
-
-    # Update each agent
+    valid_agents = []
     for agent in agents:
-        identifier = agent.get('github_identifier')
-        agent_name = agent.get('agent_name', 'Unknown')
-
-        if not identifier:
+        if not agent.get('github_identifier'):
             print(f"Warning: Skipping agent without identifier: {agent}")
             continue
+        valid_agents.append(agent)
+
+    # List PR metadata files once for the whole run instead of once per agent
+    pr_metadata_files = list_pr_metadata_files()
+
+    # Mine agents in parallel; changed files are collected and pushed in one commit
+    processed_agents = []
+    operations = []
+    with ThreadPoolExecutor(max_workers=MAX_AGENT_WORKERS) as executor:
+        futures = {
+            executor.submit(process_one_agent, agent, token, pr_metadata_files, operations): agent
+            for agent in valid_agents
+        }
+        for future in as_completed(futures):
+            if future.result():
+                processed_agents.append(futures[future])
 
-        try:
-            print(f"\n{'='*80}")
-            print(f"Processing: {agent_name} ({identifier})")
-            print(f"{'='*80}")
-
-            # Get already-mined dates for this agent (last 6 months)
-            already_mined_dates = get_already_mined_dates(identifier, n_months=6)
-
-            if already_mined_dates:
-                print(f"📅 Found {len(already_mined_dates)} already-mined dates")
-                print(f"   Re-mining ALL dates (including existing) to update metadata...")
-                # Re-mine ALL PRs (do NOT exclude already-mined dates)
-                # This ensures metadata like merged_at is updated even if day file exists
-                new_metadata = fetch_all_prs_metadata(
-                    identifier,
-                    agent_name,
-                    token,
-                    start_from_date=None,  # Use full 6-month range
-                    exclude_dates=None  # Re-mine ALL dates (no exclusions)
-                )
-            else:
-                print(f"📅 No existing data found. Mining everything from scratch...")
-                # Mine everything from scratch (full 6-month range)
-                new_metadata = fetch_all_prs_metadata(
-                    identifier,
-                    agent_name,
-                    token,
-                    start_from_date=None
-                )
-
-            if new_metadata:
-                # Save new metadata to HuggingFace (organized by agent_identifier/YYYY.MM.DD.jsonl)
-                print(f"💾 Saving {len(new_metadata)} new PR records...")
-                save_pr_metadata_to_hf(new_metadata, identifier)
-            else:
-                print(f"   No new PRs to save")
+    # Persist ETags so the next run can revalidate unchanged Search API pages cheaply
+    save_etag_cache()
 
-            # Load ALL metadata to calculate stats (aggregates entire last 6 months)
-            print(f"📊 Calculating statistics from ALL stored metadata (last 6 months)...")
-            all_metadata = load_pr_metadata()
+    # Push all changed day files as a single commit (debug runs never write to HuggingFace)
+    if not DEBUG_MODE:
+        commit_pr_metadata_operations(operations)
 
-            # Filter for this specific agent
-            agent_metadata = [pr for pr in all_metadata if pr.get('agent_identifier') == identifier]
+    # Load ALL metadata once to calculate stats (aggregates entire last 6 months)
+    print(f"\n📊 Calculating statistics from ALL stored metadata (last 6 months)...")
+    all_metadata = load_pr_metadata()
 
-            # Calculate stats from metadata
-            stats = calculate_pr_stats_from_metadata(agent_metadata)
+    # Calculate stats for all agents in one pass
+    stats_by_agent = calculate_pr_stats_by_agent(all_metadata)
+    empty_stats = calculate_pr_stats_from_metadata([])
 
-            # Merge metadata with stats
-            cache_dict[identifier] = {
-                'agent_name': agent_name,
-                'website': agent.get('website', 'Unknown'),
-                'github_identifier': identifier,
-                **stats
-            }
+    cache_dict = {}
+    for agent in processed_agents:
+        identifier = agent.get('github_identifier')
+        stats = stats_by_agent.get(identifier, empty_stats)
 
-            print(f"✓ Updated {identifier}: {stats['total_prs']} PRs, {stats['acceptance_rate']}% acceptance")
+        # Merge metadata with stats
+        cache_dict[identifier] = {
+            'agent_name': agent.get('agent_name', 'Unknown'),
+            'website': agent.get('website', 'Unknown'),
+            'github_identifier': identifier,
+            **stats
+        }
 
-        except Exception as e:
-            print(f"✗ Error updating {identifier}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            continue
+        print(f"✓ Updated {identifier}: {stats['total_prs']} PRs, {stats['acceptance_rate']}% acceptance")
 
     return cache_dict
 
@@ -1543,20 +2217,17 @@ def construct_leaderboard_from_metadata():
         print("No agents found")
         return {}
 
-    # Load all PR metadata
+    # Load all PR metadata and calculate stats for all agents in one pass
     all_metadata = load_pr_metadata()
+    stats_by_agent = calculate_pr_stats_by_agent(all_metadata)
+    empty_stats = calculate_pr_stats_from_metadata([])
 
     cache_dict = {}
 
     for agent in agents:
         identifier = agent.get('github_identifier')
         agent_name = agent.get('agent_name', 'Unknown')
-
-        # Filter metadata for this agent
-        agent_metadata = [pr for pr in all_metadata if pr.get('agent_identifier') == identifier]
-
-        # Calculate stats
-        stats = calculate_pr_stats_from_metadata(agent_metadata)
+        stats = stats_by_agent.get(identifier, empty_stats)
 
         cache_dict[identifier] = {
             'agent_name': agent_name,
@@ -1574,7 +2245,7 @@ def initialize_data():
     Constructs leaderboard from PR metadata only.
 
     In DEBUG MODE:
-    - If no data available, automatically mine up to 10 PRs per query per agent
+    - If no data available, automatically mine up to 10 PRs per agent
     - Does NOT save to HuggingFace datasets
     """
     print("🚀 Initializing leaderboard data...")
@@ -1596,11 +2267,11 @@ def initialize_data():
 
     # If in debug mode and no data available, mine immediately
     if DEBUG_MODE:
-        print("\n🐛 DEBUG MODE: No data available, mining immediately (up to 10 PRs per query per agent)...")
+        print("\n🐛 DEBUG MODE: No data available, mining immediately (up to 10 PRs per agent)...")
         agents = load_agents_from_hf()
         if agents:
             print(f"✓ Loaded {len(agents)} agents from HuggingFace")
-            print("⛏️ Mining GitHub data in debug mode (limited to 10 PRs per query)...")
+            print("⛏️ Mining GitHub data in debug mode (limited to 10 PRs per agent)...")
             cache_dict = update_all_agents_incremental()
             print("✓ Debug mining complete (data NOT saved to HuggingFace)")
             return
@@ -1757,28 +2428,26 @@ def get_leaderboard_dataframe():
         column_names = [col[0] for col in LEADERBOARD_COLUMNS]
         return pd.DataFrame(columns=column_names)
 
-    rows = []
-    for identifier, data in cache_dict.items():
-        # Filter out agents with zero total PRs
-        if data.get('total_prs', 0) > 0:
-            # Only include display-relevant fields
-            rows.append([
-                data.get('agent_name', 'Unknown'),
-                data.get('website', 'Unknown'),
-                data.get('total_prs', 0),
-                data.get('merged_prs', 0),
-                data.get('acceptance_rate', 0.0),
-            ])
-
-    # Create DataFrame
-    column_names = [col[0] for col in LEADERBOARD_COLUMNS]
-    df = pd.DataFrame(rows, columns=column_names)
+    # Build the frame straight from the cached records with a fixed column order
+    df = pd.DataFrame.from_records(
+        list(cache_dict.values()),
+        columns=['agent_name', 'website', 'total_prs', 'merged_prs', 'acceptance_rate']
+    )
+    df = df.fillna({
+        'agent_name': 'Unknown',
+        'website': 'Unknown',
+        'total_prs': 0,
+        'merged_prs': 0,
+        'acceptance_rate': 0.0,
+    })
 
     # Ensure numeric types
-    numeric_cols = ["Total PRs", "Merged PRs", "Acceptance Rate (%)"]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    numeric_cols = ['total_prs', 'merged_prs', 'acceptance_rate']
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+
+    # Filter out agents with zero total PRs and keep only display-relevant fields
+    df = df[df['total_prs'] > 0]
+    df.columns = [col[0] for col in LEADERBOARD_COLUMNS]
 
     # Sort by Acceptance Rate (%) descending
     if "Acceptance Rate (%)" in df.columns and not df.empty:
@@ -1905,7 +2574,7 @@ if DEBUG_MODE:
     print("\n" + "="*80)
     print("🐛 DEBUG MODE ENABLED 🐛")
     print("="*80)
-    print("PR retrieval is limited to 10 PRs per query pattern per agent")
+    print("PR retrieval is limited to 10 PRs per agent")
 
     # Show how debug mode was enabled
     if args.debug: